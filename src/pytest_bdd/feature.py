@@ -25,10 +25,18 @@ one line.
 """
 from __future__ import annotations
 
+import contextlib
+import functools
 import glob
+import hashlib
+import os
 import os.path
+import pickle
+from pathlib import Path
 
+from . import parser, types
 from .parser import Feature, parse_feature
+from .utils import CONFIG_STACK
 
 # Global features dictionary
 features: dict[str, Feature] = {}
@@ -51,11 +59,85 @@ def get_feature(base_path: str, filename: str, encoding: str = "utf-8") -> Featu
     full_name = os.path.abspath(os.path.join(base_path, filename))
     feature = features.get(full_name)
     if not feature:
-        feature = parse_feature(base_path, filename, encoding=encoding)
+        feature = parse_feature_cached(base_path, filename, encoding=encoding)
         features[full_name] = feature
     return feature
 
 
+def parse_feature_cached(base_path: str, filename: str, encoding: str = "utf-8") -> Feature:
+    """Parse the feature file, reusing the result of a previous test session if the file is unchanged.
+
+    :param str base_path: Base feature directory.
+    :param str filename: Filename of the feature file.
+    :param str encoding: Feature file encoding.
+
+    :return: `Feature` instance.
+
+    :note: The parsed features are only stored on disk (in the pytest cache directory) when the
+           ``bdd_feature_cache`` ini option is enabled. Otherwise this is the same as `parse_feature`.
+    """
+    __tracebackhide__ = True
+    cache_dir = get_feature_cache_dir()
+    if cache_dir is None:
+        return parse_feature(base_path, filename, encoding=encoding)
+
+    stat = os.stat(os.path.join(base_path, filename))
+    key = repr((get_parser_fingerprint(), base_path, filename, encoding, stat.st_mtime_ns, stat.st_size))
+    cache_file = cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.pickle"
+    try:
+        with cache_file.open("rb") as f:
+            cached_feature = pickle.load(f)
+    except Exception:
+        # Missing, corrupted or otherwise unusable cache entry, it will be rewritten below
+        pass
+    else:
+        if isinstance(cached_feature, Feature):
+            return cached_feature
+
+    feature = parse_feature(base_path, filename, encoding=encoding)
+
+    # Write to a temporary file first, so that concurrent sessions (e.g. xdist workers) never read a partial file
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_file.open("wb") as f:
+            pickle.dump(feature, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+    return feature
+
+
+def get_feature_cache_dir() -> Path | None:
+    """Get the directory where parsed features are stored between sessions.
+
+    :return: The directory, or `None` if the feature cache is disabled or the pytest cache is not available.
+    """
+    if not CONFIG_STACK:
+        return None
+    config = CONFIG_STACK[-1]
+    cache = getattr(config, "cache", None)
+    if cache is None or not config.getini("bdd_feature_cache"):
+        return None
+    if hasattr(cache, "mkdir"):
+        return Path(cache.mkdir("pytest-bdd-features"))
+    # pytest < 7.0 only has ``makedir``, which returns a ``py.path.local``
+    return Path(str(cache.makedir("pytest-bdd-features")))  # type: ignore[attr-defined]
+
+
+@functools.lru_cache(maxsize=None)
+def get_parser_fingerprint() -> str:
+    """Get a hash of the source code of the modules that define the parsed feature objects.
+
+    Part of the feature cache key, so that features cached by a different version of the parser are never reused.
+    """
+    fingerprint = hashlib.sha1()
+    for path in (parser.__file__, types.__file__):
+        with open(path, "rb") as f:
+            fingerprint.update(f.read())
+    return fingerprint.hexdigest()
+
+
 def get_features(paths: list[str], **kwargs) -> list[Feature]:
     """Get features for given paths.
 
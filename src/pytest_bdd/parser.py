@@ -2,9 +2,7 @@ from __future__ import annotations
 
 import os.path
 import re
-import textwrap
 import typing
-from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import cast
 
@@ -28,10 +26,22 @@ STEP_PREFIXES = [
     ("But ", None),
 ]
 
+# Group the prefixes by their first character (keeping their order), so each line is only
+# compared against the one or two prefixes it can possibly start with.
+_PREFIXES_BY_FIRST_CHAR: dict[str, list[tuple[str, str | None]]] = {}
+for _prefix, _type in STEP_PREFIXES:
+    _PREFIXES_BY_FIRST_CHAR.setdefault(_prefix[0], []).append((_prefix, _type))
+del _prefix, _type
+
 TYPES_WITH_DESCRIPTIONS = [types.FEATURE, types.SCENARIO, types.SCENARIO_OUTLINE]
 
+_SCENARIO_MODES = frozenset((types.SCENARIO, types.SCENARIO_OUTLINE))
+# Modes that may precede a step outside of any scenario, i.e. inside a Background
+_ALLOWED_PREV_MODES = frozenset((types.BACKGROUND, types.GIVEN, types.WHEN))
+_NON_STEP_MODES = frozenset((types.FEATURE, types.TAG))
+
 if typing.TYPE_CHECKING:
-    from typing import Any, Iterable, Mapping, Match, Sequence
+    from typing import Any, Iterable, Mapping, Sequence
 
 
 def split_line(line: str) -> list[str]:
@@ -41,9 +51,25 @@ def split_line(line: str) -> list[str]:
 
     :return: List of strings.
     """
+    if "\\|" not in line:
+        # No escaped pipes, so every pipe is a cell separator
+        return [cell.strip() for cell in line.split("|")[1:-1]]
     return [cell.replace("\\|", "|").strip() for cell in SPLIT_LINE_RE.split(line)[1:-1]]
 
 
+def classify_line(line: str) -> tuple[str | None, str, str]:
+    """Detect the step type and split the step prefix from the step name in a single pass.
+
+    :param line: Line of the Feature file.
+
+    :return: `tuple` in form (<step type or None>, "<prefix>", "<Line without the prefix>").
+    """
+    for prefix, _type in _PREFIXES_BY_FIRST_CHAR.get(line[:1], ()):
+        if line.startswith(prefix):
+            return _type, prefix.strip(), line[len(prefix) :].strip()
+    return None, "", line
+
+
 def parse_line(line: str) -> tuple[str, str]:
     """Parse step line to get the step prefix (Scenario, Given, When, Then or And) and the actual step name.
 
@@ -51,10 +77,8 @@ def parse_line(line: str) -> tuple[str, str]:
 
     :return: `tuple` in form ("<prefix>", "<Line without the prefix>").
     """
-    for prefix, _ in STEP_PREFIXES:
-        if line.startswith(prefix):
-            return prefix.strip(), line[len(prefix) :].strip()
-    return "", line
+    _, keyword, parsed_line = classify_line(line)
+    return keyword, parsed_line
 
 
 def strip_comments(line: str) -> str:
@@ -64,6 +88,8 @@ def strip_comments(line: str) -> str:
 
     :return: Stripped line.
     """
+    if "#" not in line:
+        return line.strip()
     res = COMMENT_RE.search(line)
     if res:
         line = line[: res.start()]
@@ -77,10 +103,7 @@ def get_step_type(line: str) -> str | None:
 
     :return: SCENARIO, GIVEN, WHEN, THEN, or `None` if can't be detected.
     """
-    for prefix, _type in STEP_PREFIXES:
-        if line.startswith(prefix):
-            return _type
-    return None
+    return classify_line(line)[0]
 
 
 def parse_feature(basedir: str, filename: str, encoding: str = "utf-8") -> Feature:
@@ -94,12 +117,12 @@ def parse_feature(basedir: str, filename: str, encoding: str = "utf-8") -> Featu
     abs_filename = os.path.abspath(os.path.join(basedir, filename))
     rel_filename = os.path.join(os.path.basename(basedir), filename)
     feature = Feature(
-        scenarios=OrderedDict(),
+        scenarios={},
         filename=abs_filename,
         rel_filename=rel_filename,
         line_number=1,
         name=None,
-        tags=set(),
+        tags=frozenset(),
         background=None,
         description="",
     )
@@ -109,94 +132,94 @@ def parse_feature(basedir: str, filename: str, encoding: str = "utf-8") -> Featu
     description: list[str] = []
     step = None
     multiline_step = False
-    prev_line = None
+    # Tags of the previous line, if it was a tag line
+    pending_tags: frozenset[str] | None = None
 
     with open(abs_filename, encoding=encoding) as f:
-        content = f.read()
-
-    for line_number, line in enumerate(content.splitlines(), start=1):
-        unindented_line = line.lstrip()
-        line_indent = len(line) - len(unindented_line)
-        if step and (step.indent < line_indent or ((not unindented_line) and multiline_step)):
-            multiline_step = True
-            # multiline step, so just add line and continue
-            step.add_line(line)
-            continue
-        else:
-            step = None
-            multiline_step = False
-        stripped_line = line.strip()
-        clean_line = strip_comments(line)
-        if not clean_line and (not prev_mode or prev_mode not in TYPES_WITH_DESCRIPTIONS):
-            # Blank lines are included in feature and scenario descriptions
-            continue
-        mode = get_step_type(clean_line) or mode
-
-        allowed_prev_mode = (types.BACKGROUND, types.GIVEN, types.WHEN)
-
-        if not scenario and prev_mode not in allowed_prev_mode and mode in types.STEP_TYPES:
-            raise exceptions.FeatureError(
-                "Step definition outside of a Scenario or a Background", line_number, clean_line, filename
-            )
-
-        if mode == types.FEATURE:
-            if prev_mode is None or prev_mode == types.TAG:
-                _, feature.name = parse_line(clean_line)
-                feature.line_number = line_number
-                feature.tags = get_tags(prev_line)
-            elif prev_mode == types.FEATURE:
-                # Do not include comments in descriptions
-                if not stripped_line.startswith("#"):
-                    description.append(clean_line)
+        # The file object only splits on \n, \r and \r\n; splitting each of its lines again keeps the
+        # ``str.splitlines`` semantics (form feeds, unicode line separators, ...) of reading the file at once.
+        lines = (line for raw_line in f for line in raw_line.splitlines())
+        for line_number, line in enumerate(lines, start=1):
+            unindented_line = line.lstrip()
+            line_indent = len(line) - len(unindented_line)
+            if step and (step.indent < line_indent or ((not unindented_line) and multiline_step)):
+                multiline_step = True
+                # multiline step, so just add line and continue
+                step.add_line(line)
+                continue
             else:
+                step = None
+                multiline_step = False
+            # Reuse the left-stripped line rather than scanning the whole line again
+            stripped_line = unindented_line.rstrip()
+            clean_line = strip_comments(stripped_line)
+            if not clean_line and (not prev_mode or prev_mode not in TYPES_WITH_DESCRIPTIONS):
+                # Blank lines are included in feature and scenario descriptions
+                continue
+            # Detect the step type and remove Feature, Given, When, Then, And
+            step_type, keyword, parsed_line = classify_line(clean_line)
+            mode = step_type or mode
+
+            if not scenario and prev_mode not in _ALLOWED_PREV_MODES and mode in types.STEP_TYPES:
                 raise exceptions.FeatureError(
-                    "Multiple features are not allowed in a single feature file",
-                    line_number,
-                    clean_line,
-                    filename,
+                    "Step definition outside of a Scenario or a Background", line_number, clean_line, filename
                 )
 
-        prev_mode = mode
-
-        # Remove Feature, Given, When, Then, And
-        keyword, parsed_line = parse_line(clean_line)
-
-        if mode in [types.SCENARIO, types.SCENARIO_OUTLINE]:
-            # Lines between the scenario declaration
-            # and the scenario's first step line
-            # are considered part of the scenario description.
-            if scenario and not keyword:
-                # Do not include comments in descriptions
-                if not stripped_line.startswith("#"):
-                    scenario.add_description_line(clean_line)
-                continue
-            tags = get_tags(prev_line)
-            scenario = ScenarioTemplate(
-                feature=feature,
-                name=parsed_line,
-                line_number=line_number,
-                tags=tags,
-                templated=mode == types.SCENARIO_OUTLINE,
-            )
-            feature.scenarios[parsed_line] = scenario
-        elif mode == types.BACKGROUND:
-            feature.background = Background(feature=feature, line_number=line_number)
-        elif mode == types.EXAMPLES:
-            mode = types.EXAMPLES_HEADERS
-            scenario.examples.line_number = line_number
-        elif mode == types.EXAMPLES_HEADERS:
-            scenario.examples.set_param_names([l for l in split_line(parsed_line) if l])
-            mode = types.EXAMPLE_LINE
-        elif mode == types.EXAMPLE_LINE:
-            scenario.examples.add_example([l for l in split_line(stripped_line)])
-        elif mode and mode not in (types.FEATURE, types.TAG):
-            step = Step(name=parsed_line, type=mode, indent=line_indent, line_number=line_number, keyword=keyword)
-            if feature.background and not scenario:
-                feature.background.add_step(step)
-            else:
-                scenario = cast(ScenarioTemplate, scenario)
-                scenario.add_step(step)
-        prev_line = clean_line
+            if mode == types.FEATURE:
+                if prev_mode is None or prev_mode == types.TAG:
+                    feature.name = parsed_line
+                    feature.line_number = line_number
+                    feature.tags = pending_tags or frozenset()
+                elif prev_mode == types.FEATURE:
+                    # Do not include comments in descriptions
+                    if not stripped_line.startswith("#"):
+                        description.append(clean_line)
+                else:
+                    raise exceptions.FeatureError(
+                        "Multiple features are not allowed in a single feature file",
+                        line_number,
+                        clean_line,
+                        filename,
+                    )
+
+            prev_mode = mode
+
+            if mode in _SCENARIO_MODES:
+                # Lines between the scenario declaration
+                # and the scenario's first step line
+                # are considered part of the scenario description.
+                if scenario and not keyword:
+                    # Do not include comments in descriptions
+                    if not stripped_line.startswith("#"):
+                        scenario.add_description_line(clean_line)
+                    continue
+                tags = pending_tags or frozenset()
+                scenario = ScenarioTemplate(
+                    feature=feature,
+                    name=parsed_line,
+                    line_number=line_number,
+                    tags=tags,
+                    templated=mode == types.SCENARIO_OUTLINE,
+                )
+                feature.scenarios[parsed_line] = scenario
+            elif mode == types.BACKGROUND:
+                feature.background = Background(feature=feature, line_number=line_number)
+            elif mode == types.EXAMPLES:
+                mode = types.EXAMPLES_HEADERS
+                scenario.examples.line_number = line_number
+            elif mode == types.EXAMPLES_HEADERS:
+                scenario.examples.set_param_names([l for l in split_line(parsed_line) if l])
+                mode = types.EXAMPLE_LINE
+            elif mode == types.EXAMPLE_LINE:
+                scenario.examples.add_example(split_line(stripped_line))
+            elif mode and mode not in _NON_STEP_MODES:
+                step = Step(name=parsed_line, type=mode, indent=line_indent, line_number=line_number, keyword=keyword)
+                if feature.background and not scenario:
+                    feature.background.add_step(step)
+                else:
+                    scenario = cast(ScenarioTemplate, scenario)
+                    scenario.add_step(step)
+            pending_tags = get_tags(clean_line) if step_type == types.TAG else None
 
     feature.description = "\n".join(description).strip()
     return feature
@@ -204,11 +227,22 @@ def parse_feature(basedir: str, filename: str, encoding: str = "utf-8") -> Featu
 
 @dataclass
 class Feature:
-    scenarios: OrderedDict[str, ScenarioTemplate]
+    __slots__ = (
+        "scenarios",
+        "filename",
+        "rel_filename",
+        "name",
+        "tags",
+        "background",
+        "line_number",
+        "description",
+    )
+
+    scenarios: dict[str, ScenarioTemplate]
     filename: str
     rel_filename: str
     name: str | None
-    tags: set[str]
+    tags: frozenset[str]
     background: Background | None
     line_number: int
     description: str
@@ -225,7 +259,7 @@ class ScenarioTemplate:
     name: str
     line_number: int
     templated: bool
-    tags: set[str] = field(default_factory=set)
+    tags: frozenset[str] = field(default_factory=frozenset)
     examples: Examples | None = field(default_factory=lambda: Examples())
     _steps: list[Step] = field(init=False, default_factory=list)
     _description_lines: list[str] = field(init=False, default_factory=list)
@@ -240,7 +274,8 @@ class ScenarioTemplate:
         return (background.steps if background else []) + self._steps
 
     def render(self, context: Mapping[str, Any]) -> Scenario:
-        background_steps = self.feature.background.steps if self.feature.background else []
+        background = self.feature.background
+        background_steps = background.steps if background else []
         if not self.templated:
             scenario_steps = self._steps
         else:
@@ -284,21 +319,39 @@ class Scenario:
     name: str
     line_number: int
     steps: list[Step]
-    tags: set[str] = field(default_factory=set)
+    tags: frozenset[str] = field(default_factory=frozenset)
     description: list[str] = field(default_factory=list)
 
 
 @dataclass
 class Step:
+    # ``__slots__`` can't coexist with class-level field defaults, so ``__init__`` sets every attribute.
+    # The cache attributes are not dataclass fields, which keeps them out of ``__eq__`` and ``__repr__``.
+    __slots__ = (
+        "type",
+        "_name",
+        "line_number",
+        "indent",
+        "keyword",
+        "failed",
+        "scenario",
+        "background",
+        "lines",
+        "_cached_name",
+        "_template",
+        "_cached_params",
+        "_lines_margin",
+    )
+
     type: str
     _name: str
     line_number: int
     indent: int
     keyword: str
-    failed: bool = field(init=False, default=False)
-    scenario: ScenarioTemplate | None = field(init=False, default=None)
-    background: Background | None = field(init=False, default=None)
-    lines: list[str] = field(init=False, default_factory=list)
+    failed: bool
+    scenario: ScenarioTemplate | None
+    background: Background | None
+    lines: list[str]
 
     def __init__(self, name: str, type: str, indent: int, line_number: int, keyword: str) -> None:
         self.name = name
@@ -311,6 +364,8 @@ class Step:
         self.scenario = None
         self.background = None
         self.lines = []
+        # Leading whitespace common to all the non-blank lines, kept up to date by ``add_line``
+        self._lines_margin: str | None = None
 
     def add_line(self, line: str) -> None:
         """Add line to the multiple step.
@@ -318,25 +373,45 @@ class Step:
         :param str line: Line of text - the continuation of the step name.
         """
         self.lines.append(line)
+        # Same notion of whitespace as ``textwrap.dedent``: only spaces and tabs count
+        unindented_line = line.lstrip(" \t")
+        if unindented_line:
+            indent = line[: len(line) - len(unindented_line)]
+            if self._lines_margin is None:
+                self._lines_margin = indent
+            elif not indent.startswith(self._lines_margin):
+                self._lines_margin = os.path.commonprefix([self._lines_margin, indent])
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        """Forget everything derived from the step name."""
+        self._cached_name: str | None = None
+        self._template: tuple[list[str], list[str]] | None = None
+        self._cached_params: tuple[str, ...] | None = None
 
     @property
     def name(self) -> str:
-        multilines_content = textwrap.dedent("\n".join(self.lines)) if self.lines else ""
+        if self._cached_name is not None:
+            return self._cached_name
+
+        # Equivalent to ``textwrap.dedent("\n".join(self.lines))``, using the margin computed by ``add_line``
+        margin_len = len(self._lines_margin or "")
+        multilines_content = "\n".join(line[margin_len:] if line.strip(" \t") else "" for line in self.lines)
 
         # Remove the multiline quotes, if present.
-        multilines_content = re.sub(
-            pattern=r'^"""\n(?P<content>.*)\n"""$',
-            repl=r"\g<content>",
-            string=multilines_content,
-            flags=re.DOTALL,  # Needed to make the "." match also new lines
-        )
+        # A single trailing new line is allowed after the closing quotes (it's stripped from the name anyway).
+        quoted_content = multilines_content[:-1] if multilines_content.endswith("\n") else multilines_content
+        if len(quoted_content) >= 8 and quoted_content.startswith('"""\n') and quoted_content.endswith('\n"""'):
+            multilines_content = quoted_content[4:-4]
 
         lines = [self._name] + [multilines_content]
-        return "\n".join(lines).strip()
+        self._cached_name = "\n".join(lines).strip()
+        return self._cached_name
 
     @name.setter
     def name(self, value: str) -> None:
         self._name = value
+        self._clear_cache()
 
     def __str__(self) -> str:
         """Full step name including the type."""
@@ -344,14 +419,36 @@ class Step:
 
     @property
     def params(self) -> tuple[str, ...]:
-        return tuple(frozenset(STEP_PARAM_RE.findall(self.name)))
+        if self._cached_params is None:
+            self._cached_params = tuple(dict.fromkeys(STEP_PARAM_RE.findall(self.name)))
+        return self._cached_params
+
+    def _compile_template(self) -> tuple[list[str], list[str]]:
+        """Split the step name into the literal text around its parameters and the parameter names.
+
+        :return: `tuple` in form ([<literal>, ...], [<param name>, ...]), with one more literal than params.
+        """
+        name = self.name
+        literals = []
+        param_names = []
+        pos = 0
+        for m in STEP_PARAM_RE.finditer(name):
+            literals.append(name[pos : m.start()])
+            param_names.append(m.group(1))
+            pos = m.end()
+        literals.append(name[pos:])
+        return literals, param_names
 
     def render(self, context: Mapping[str, Any]) -> str:
-        def replacer(m: Match):
-            varname = m.group(1)
-            return str(context[varname])
+        if self._template is None:
+            self._template = self._compile_template()
+        literals, param_names = self._template
 
-        return STEP_PARAM_RE.sub(replacer, self.name)
+        parts = [literals[0]]
+        for param_name, literal in zip(param_names, literals[1:]):
+            parts.append(str(context[param_name]))
+            parts.append(literal)
+        return "".join(parts)
 
 
 @dataclass
@@ -396,13 +493,16 @@ class Examples:
         return bool(self.examples)
 
 
-def get_tags(line: str | None) -> set[str]:
+def get_tags(line: str | None) -> frozenset[str]:
     """Get tags out of the given line.
 
     :param str line: Feature file text line.
 
-    :return: List of tags.
+    :return: Set of tags.
     """
-    if not line or not line.strip().startswith("@"):
-        return set()
-    return {tag.lstrip("@") for tag in line.strip().split(" @") if len(tag) > 1}
+    if not line:
+        return frozenset()
+    line = line.strip()
+    if not line.startswith("@"):
+        return frozenset()
+    return frozenset(tag.lstrip("@") for tag in line.split(" @") if len(tag) > 1)
@@ -60,6 +60,12 @@ def pytest_addoption(parser: Parser) -> None:
 
 def add_bdd_ini(parser: Parser) -> None:
     parser.addini("bdd_features_base_dir", "Base features directory.")
+    parser.addini(
+        "bdd_feature_cache",
+        "Store parsed feature files in the pytest cache directory and reuse them while they are unchanged.",
+        type="bool",
+        default=False,
+    )
 
 
 @pytest.hookimpl(trylast=True)
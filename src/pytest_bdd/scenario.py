@@ -307,8 +307,8 @@ def get_from_ini(key: str, default: str) -> str:
 
 def make_python_name(string: str) -> str:
     """Make python attribute name out of a given string."""
-    string = re.sub(PYTHON_REPLACE_REGEX, "", string.replace(" ", "_"))
-    return re.sub(ALPHA_REGEX, "", string).lower()
+    string = PYTHON_REPLACE_REGEX.sub("", string.replace(" ", "_"))
+    return ALPHA_REGEX.sub("", string).lower()
 
 
 def make_python_docstring(string: str) -> str:
@@ -68,3 +68,60 @@ def test_description(pytester):
 
     result = pytester.runpytest()
     result.assert_outcomes(passed=3)
+
+
+def test_description_comments(pytester):
+    """Test that comments are not included in the feature and scenario descriptions."""
+    pytester.makefile(
+        ".feature",
+        description=textwrap.dedent(
+            """\
+        Feature: Description
+
+            In order to achieve something
+            # Comment lines are not part of the description
+            I want something  # and neither are trailing comments
+
+            Scenario: Description
+                Also, the scenario can have a description.  # with a comment
+                # Even between the description lines
+                It goes here.
+                Given I have a bar
+        """
+        ),
+    )
+
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+        import textwrap
+        from pytest_bdd import given, scenario
+
+        @scenario("description.feature", "Description")
+        def test_description():
+            pass
+
+
+        @given("I have a bar")
+        def _():
+            return "bar"
+
+        def test_feature_description():
+            assert test_description.__scenario__.feature.description == textwrap.dedent(
+                \"\"\"\\
+                In order to achieve something
+                I want something\"\"\"
+            )
+
+        def test_scenario_description():
+            assert test_description.__scenario__.description == textwrap.dedent(
+                \"\"\"\\
+                Also, the scenario can have a description.
+                It goes here.\"\"\"
+            )
+        """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=3)
@@ -0,0 +1,89 @@
+"""Test the on-disk cache of parsed feature files."""
+import os
+import textwrap
+
+from pytest_bdd.utils import collect_dumped_objects
+
+
+def prepare_testdir(pytester, step):
+    pytester.makefile(
+        ".feature",
+        cached=textwrap.dedent(
+            f"""\
+            Feature: Cached feature
+                Scenario: Cached scenario
+                    Given {step}
+            """
+        ),
+    )
+    pytester.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+            from pytest_bdd.utils import dump_obj
+
+            scenarios("cached.feature")
+
+
+            @given("foo")
+            def _():
+                dump_obj("foo")
+
+
+            @given("bar")
+            def _():
+                dump_obj("bar")
+            """
+        )
+    )
+
+
+def cached_files(pytester):
+    cache_dir = pytester.path / ".pytest_cache" / "d" / "pytest-bdd-features"
+    if not cache_dir.exists():
+        return []
+    return sorted(path.name for path in cache_dir.iterdir())
+
+
+def test_feature_cache_disabled_by_default(pytester):
+    prepare_testdir(pytester, "foo")
+
+    result = pytester.runpytest_subprocess()
+    result.assert_outcomes(passed=1)
+    assert cached_files(pytester) == []
+
+
+def test_feature_cache(pytester):
+    pytester.makeini(
+        """
+        [pytest]
+        bdd_feature_cache = true
+        """
+    )
+    prepare_testdir(pytester, "foo")
+
+    result = pytester.runpytest_subprocess("-s")
+    result.assert_outcomes(passed=1)
+    assert collect_dumped_objects(result) == ["foo"]
+    [cache_file] = cached_files(pytester)
+    assert cache_file.endswith(".pickle")
+
+    # Rewrite the feature with a step of the same length and restore its mtime: the file looks unchanged,
+    # so the cached feature (still using the "foo" step) is used instead of parsing the file again
+    feature_path = pytester.path / "cached.feature"
+    stat = feature_path.stat()
+    prepare_testdir(pytester, "bar")
+    os.utime(feature_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    result = pytester.runpytest_subprocess("-s")
+    result.assert_outcomes(passed=1)
+    assert collect_dumped_objects(result) == ["foo"]
+    assert cached_files(pytester) == [cache_file]
+
+    # Changing the modification time invalidates the cache entry
+    os.utime(feature_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    result = pytester.runpytest_subprocess("-s")
+    result.assert_outcomes(passed=1)
+    assert collect_dumped_objects(result) == ["bar"]
+    assert len(cached_files(pytester)) == 2
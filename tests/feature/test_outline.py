@@ -1,6 +1,9 @@
 """Scenario Outline tests."""
 import textwrap
 
+import pytest
+
+from pytest_bdd.parser import split_line
 from pytest_bdd.utils import collect_dumped_objects
 
 STEPS = """\
@@ -219,3 +222,17 @@ def test_outline_with_escaped_pipes(pytester):
         r"bork      \\",
         r"bork    \\|",
     ]
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("| foo | bar |", ["foo", "bar"]),
+        ("|foo||bar|", ["foo", "", "bar"]),
+        (r"| \|foo | bar\| |", ["|foo", "bar|"]),
+        (r"| foo \\| bar |", [r"foo \| bar"]),
+        ("no pipes", []),
+    ],
+)
+def test_split_line(line, expected):
+    assert split_line(line) == expected